@@ -13,8 +13,14 @@ from mistletoe.block_token import Heading, Paragraph, BlockCode, List, ListItem,
 from mistletoe.span_token import RawText, Emphasis, Strong, InlineCode, LineBreak, Link
 from typst_renderer import TypstRenderer
 
-def convert_md_to_typst(input_file, output_file):
-    """Convert Markdown file to Typst format, sorting content by H1 headings"""
+def convert_md_to_typst(input_file, output_file, volumes=1):
+    """Convert Markdown file to Typst format, sorting content by H1 headings.
+
+    If volumes is greater than 1 the sorted sections are split into that many
+    standalone Typst files of roughly equal size, so they can compile in parallel.
+    Each volume is labelled with its first and last entry titles, like an
+    encyclopedia spine (e.g. "Aelstrom Spire – Emberroot").
+    """
     with open(input_file, 'r', encoding='utf-8') as f:
         md_content = f.read()
 
@@ -68,6 +74,100 @@ def convert_md_to_typst(input_file, output_file):
             heading.children[0].content = f'{title} #index-main("{title}")'
 
 
+    if volumes <= 1:
+        with TypstRenderer() as r:
+            typst_output = render_typst(r, ast)
+
+        # Write to output file
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(typst_output)
+
+        print(f"Converted {input_file} to {output_file}")
+        print(f"Sorted {len(sorted_sections)} sections by H1 headings.")
+        return
+
+    groups = split_volumes(final_sections, volumes)
+    base, ext = os.path.splitext(output_file)
+    with TypstRenderer() as r:
+        # footnote definitions may sit in another volume, so give every volume all of them
+        definitions = TypstRenderer.footnote_definitions(ast.children)
+        footnote_nodes = [ast.children[i] for i in definitions]
+        for number, group in enumerate(groups, start=1):
+            titles = [title for title, _ in group if title != "Unsorted Content"]
+            span = volume_span(titles)
+            ast.children = [node for _, nodes in group for node in nodes] + footnote_nodes
+            typst_output = render_typst(
+                r, ast, subtitle=f"Volume {number} #linebreak() {span}")
+
+            volume_file = f"{base}-{number}{ext}"
+            with open(volume_file, 'w', encoding='utf-8') as f:
+                f.write(typst_output)
+            print(f"Converted {input_file} to {volume_file} ({len(group)} sections, {span})")
+
+    print(f"Sorted {len(sorted_sections)} sections by H1 headings into {len(groups)} volumes.")
+
+
+def volume_span(titles):
+    """Label a volume by its first and last entry titles"""
+    if not titles:
+        return ""
+    if len(titles) == 1:
+        return titles[0]
+    return f"{titles[0]} – {titles[-1]}"
+
+
+def estimate_size(nodes):
+    """Estimate the rendered size of AST nodes by counting their text content.
+
+    Footnote definitions are skipped, as every volume renders against all of them.
+    """
+    definitions = TypstRenderer.footnote_definitions(nodes)
+    size = 0
+    for i, node in enumerate(nodes):
+        if i in definitions:
+            continue
+        children = getattr(node, 'children', None)
+        if children:
+            size += estimate_size(children)
+        else:
+            size += len(getattr(node, 'content', None) or '')
+    return size
+
+
+def split_volumes(sections, volumes):
+    """Split sorted sections into contiguous groups of roughly equal estimated size.
+
+    Returns min(volumes, len(sections)) groups; sections with no measurable
+    content are spread evenly by count.
+    """
+    if not sections:
+        return []
+    volumes = max(1, min(volumes, len(sections)))
+    sizes = [estimate_size(nodes) for _, nodes in sections]
+    total = sum(sizes)
+    if not total:
+        sizes = [1] * len(sections)
+        total = len(sections)
+    groups = [[]]
+    done = 0
+    for i, (section, size) in enumerate(zip(sections, sizes)):
+        if groups[-1] and len(groups) < volumes:
+            # start the next volume once this section would end nearer the next boundary,
+            # or when every remaining section is needed to fill the remaining volumes
+            boundary = total * len(groups) / volumes
+            if done + size / 2 > boundary or len(sections) - i == volumes - len(groups):
+                groups.append([])
+        groups[-1].append(section)
+        done += size
+    return groups
+
+
+def render_typst(renderer, ast, subtitle=None):
+    """Render the AST as a standalone Typst document with title page and index"""
+    title = "#v(-90pt)On the #linebreak() Nature of #linebreak() Bremwith"
+    if subtitle:
+        title += f" #linebreak() #text(size: 30pt)[{subtitle}]"
+
     # Begin Typst output
     typst_output = ''
     typst_output += """#import "@preview/in-dexter:0.7.0": *
@@ -77,33 +177,19 @@ def convert_md_to_typst(input_file, output_file):
 #import "fantasy-encyclopedia.typ": fantasy-encyclopedia
 #show: fantasy-encyclopedia.with(
   title: [
-    #v(-90pt)On the #linebreak() Nature of #linebreak() Bremwith
+    """ + title + """
   ]
 )
 """
 
-    # Render each section
-    #for title, nodes in final_sections:
-    #    typst_output += render_nodes(nodes)
-    with TypstRenderer() as r:
-        typst_output += r.render(ast)
-
-
-
-
+    typst_output += renderer.render(ast)
 
     typst_output +="""\n#pagebreak()
 = Index
 #columns(2)[
   #make-index(title: none)
-  ]"""    
-
-    # Write to output file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(typst_output)
-
-    print(f"Converted {input_file} to {output_file}")
-    print(f"Sorted {len(sorted_sections)} sections by H1 headings.")
+  ]"""
+    return typst_output
 
 
 # def render_nodes(nodes):
@@ -163,14 +249,20 @@ def convert_md_to_typst(input_file, output_file):
 
 
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python md_to_typst.py input.md output.typ")
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python md_to_typst.py input.md output.typ [volumes]")
         sys.exit(1)
     input_file, output_file = sys.argv[1], sys.argv[2]
+    volumes = 1
+    if len(sys.argv) == 4:
+        if not sys.argv[3].isdigit() or int(sys.argv[3]) < 1:
+            print(f"Error: volumes must be a positive number, got '{sys.argv[3]}'")
+            sys.exit(1)
+        volumes = int(sys.argv[3])
     if not os.path.isfile(input_file):
         print(f"Error: input file '{input_file}' does not exist")
         sys.exit(1)
-    convert_md_to_typst(input_file, output_file)
+    convert_md_to_typst(input_file, output_file, volumes)
 
 if __name__ == "__main__":
     main()
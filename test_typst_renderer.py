@@ -1,6 +1,9 @@
+import os
+import tempfile
 import unittest
 from mistletoe import Document
 from typst_renderer import TypstRenderer
+from md_to_typst import convert_md_to_typst, split_volumes
 
 
 class TypstRendererTest(unittest.TestCase):
@@ -16,6 +19,86 @@ class TypstRendererTest(unittest.TestCase):
         print(output)
         self.assertEqual(output, expected)
 
+    def test_repeated_footnote(self):
+        md = "First[^1] and second[^1].\n\n[^1]: Shared note\n"
+        renderer = TypstRenderer()
+        output = renderer.render(Document(md))
+        self.assertEqual(output.count("#footnote[Shared note]<fn-1>"), 1)
+        self.assertIn("second#footnote(<fn-1>).", output)
+
+
+def make_sections(sizes):
+    """Build (title, nodes) sections whose estimated size is given by `sizes`"""
+    return [
+        (chr(ord("A") + i), Document("x" * size).children if size else [])
+        for i, size in enumerate(sizes)
+    ]
+
+
+class SplitVolumesTest(unittest.TestCase):
+    def titles(self, groups):
+        return [[title for title, _ in group] for group in groups]
+
+    def test_groups_are_contiguous_and_sorted(self):
+        sections = make_sections([5, 9, 2, 7, 3, 8, 4])
+        for volumes in range(1, 9):
+            groups = split_volumes(sections, volumes)
+            self.assertEqual(len(groups), min(volumes, len(sections)))
+            self.assertTrue(all(groups))
+            self.assertEqual(
+                [title for group in self.titles(groups) for title in group],
+                [title for title, _ in sections])
+
+    def test_equal_sizes_balance(self):
+        groups = split_volumes(make_sections([10] * 6), 3)
+        self.assertEqual(self.titles(groups), [["A", "B"], ["C", "D"], ["E", "F"]])
+
+    def test_unequal_sizes_balance(self):
+        groups = split_volumes(make_sections([30, 10, 10, 10, 30]), 2)
+        self.assertEqual(self.titles(groups), [["A", "B", "C"], ["D", "E"]])
+
+    def test_very_large_section(self):
+        groups = split_volumes(make_sections([10, 10, 100, 10, 10]), 3)
+        self.assertEqual(self.titles(groups), [["A", "B"], ["C"], ["D", "E"]])
+
+    def test_forced_split_fills_every_volume(self):
+        groups = split_volumes(make_sections([100, 1, 1]), 3)
+        self.assertEqual(self.titles(groups), [["A"], ["B"], ["C"]])
+
+    def test_more_volumes_than_sections(self):
+        groups = split_volumes(make_sections([10, 20]), 5)
+        self.assertEqual(self.titles(groups), [["A"], ["B"]])
+
+    def test_no_sections(self):
+        self.assertEqual(split_volumes([], 3), [])
+
+    def test_all_zero_sizes(self):
+        groups = split_volumes(make_sections([0] * 6), 3)
+        self.assertEqual(self.titles(groups), [["A", "B"], ["C", "D"], ["E", "F"]])
+
+    def test_convert_volumes(self):
+        md = (
+            "# Alpha\n\nSee the note[^1].\n\n"
+            "# Beta\n\nBody.\n\n"
+            "# Gamma\n\nMore.\n\n[^1]: Late note\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            input_file = os.path.join(tmp, "in.md")
+            with open(input_file, "w", encoding="utf-8") as f:
+                f.write(md)
+            convert_md_to_typst(input_file, os.path.join(tmp, "out.typ"), volumes=3)
+            outputs = []
+            for number in range(1, 4):
+                with open(os.path.join(tmp, f"out-{number}.typ"), encoding="utf-8") as f:
+                    outputs.append(f.read())
+            self.assertFalse(os.path.exists(os.path.join(tmp, "out-4.typ")))
+
+        self.assertIn("note#footnote[Late note]<fn-1>.", outputs[0])
+        for number, (output, title) in enumerate(zip(outputs, ["Alpha", "Beta", "Gamma"]), start=1):
+            self.assertIn(f"Volume {number} #linebreak() {title}]", output)
+            self.assertIn("#make-index(title: none)", output)
+        self.assertNotIn("[^1]", outputs[2])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -20,7 +20,7 @@ eveniet nostrum et quo eos ratione.
 ]
 
 #link("https://neilzone.co.uk")[This is a link];.#footnote[This is a
-footnote]
+footnote]<fn-1>
 
 Consequatur aut officia deserunt voluptatum autem voluptatem voluptatum
 neque. Qui vel ut sint unde neque possimus dolorem. A harum doloribus
@@ -49,7 +49,7 @@ This is before the break.
 
 This is after the break.
 
-== A table#footnote[another footnote]
+== A table#footnote[another footnote]<fn-2>
 <a-table2>
 This is a table:
 
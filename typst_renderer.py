@@ -49,6 +49,8 @@ class TypstRenderer(BaseRenderer):
         self.normalize_whitespace = normalize_whitespace
         # mapping for inline footnotes: number -> text
         self.footnotes = {}
+        # footnote numbers already emitted as labelled footnotes
+        self.emitted_footnotes = set()
 
     def slugify(self, text: str) -> str:
         """
@@ -60,6 +62,50 @@ class TypstRenderer(BaseRenderer):
         # trim leading/trailing hyphens
         return s.strip('-')
 
+    def footnote_label(self, num: str) -> str:
+        """
+        Create the Typst label used to refer back to footnote `num`.
+        """
+        return f"fn-{num}"
+
+    def footnote_ref(self, num: str) -> str:
+        """
+        Typst markup for a footnote reference. The first reference emits the
+        footnote body with a label, later references point back to that label.
+        """
+        label = self.footnote_label(num)
+        if num in self.emitted_footnotes:
+            return f"#footnote(<{label}>)"
+        self.emitted_footnotes.add(num)
+        foot = self.footnotes.get(num, '')
+        return f"#footnote[{foot}]<{label}>"
+
+    @staticmethod
+    def footnote_definitions(children: Sequence[token.Token]) -> dict:
+        """
+        Find "[^n]: text" definition paragraphs among `children`.
+        Returns a mapping of index -> (number, text).
+        """
+        definitions = {}
+        for i, child in enumerate(children):
+            if isinstance(child, block_token.Paragraph) and len(child.children) == 1:
+                span = child.children[0]
+                if isinstance(span, span_token.RawText):
+                    m = re.match(r'^\[\^(?P<num>\d+)\]:\s*(?P<txt>.*)', span.content)
+                    if m:
+                        definitions[i] = (m.group('num'), m.group('txt'))
+        return definitions
+
+    def collect_footnotes(self, children: Sequence[token.Token]) -> dict:
+        """
+        Build the footnote mapping (number -> text) from "[^n]: text"
+        definition paragraphs. Returns the indices of the definitions.
+        """
+        definitions = self.footnote_definitions(children)
+        for num, txt in definitions.values():
+            self.footnotes[num] = txt
+        return definitions
+
     def render(self, token: token.Token) -> str:
         if isinstance(token, block_token.BlockToken):
             lines = self.render_map[token.__class__.__name__](
@@ -84,10 +130,8 @@ class TypstRenderer(BaseRenderer):
                 continue
             m = re.match(r'\[\^(?P<num>\d+)\]', part)
             if m:
-                num = m.group('num')
-                # insert Typst footnote macro
-                foot = self.footnotes.get(num, '')
-                yield Fragment(f'#footnote[{foot}]', wordwrap=True)
+                # insert Typst footnote macro, or a reference to an earlier one
+                yield Fragment(self.footnote_ref(m.group('num')), wordwrap=True)
             else:
                 # replace straight apostrophes with typographic curly apostrophes
                 text = part.replace("'", "’")
@@ -160,32 +204,26 @@ class TypstRenderer(BaseRenderer):
     def render_document(
         self, token: block_token.Document, max_line_length: int
     ) -> Iterable[str]:
-        # extract footnote definitions and build mapping, skip def blocks and following blank lines
-        filtered_children = []
+        # build footnote mapping up front, then skip def blocks and following blank lines
         children = token.children
+        self.footnotes = {}
+        self.emitted_footnotes = set()
+        definitions = self.collect_footnotes(children)
+        filtered_children = []
         i = 0
         while i < len(children):
-            child = children[i]
-            # detect footnote definition paragraph: "[^n]: text"
-            if isinstance(child, block_token.Paragraph) and len(child.children) == 1:
-                span = child.children[0]
-                if isinstance(span, span_token.RawText):
-                    m = re.match(r'^\[\^(?P<num>\d+)\]:\s*(?P<txt>.*)', span.content)
-                    if m:
-                        # store footnote text
-                        self.footnotes[m.group('num')] = m.group('txt')
-                        # if definition follows a table, remove preceding blank line
-                        if i > 1 and isinstance(children[i-2], block_token.Table):
-                            # remove blankline before definition if present in filtered_children
-                            if filtered_children and isinstance(filtered_children[-1], BlankLine):
-                                filtered_children.pop()
-                        # skip this definition
-                        i += 1
-                        # skip following blank line if present
-                        if i < len(children) and isinstance(children[i], BlankLine):
-                            i += 1
-                        continue
-            filtered_children.append(child)
+            if i in definitions:
+                # if definition follows a table, remove preceding blank line
+                if i > 1 and isinstance(children[i-2], block_token.Table):
+                    if filtered_children and isinstance(filtered_children[-1], BlankLine):
+                        filtered_children.pop()
+                # skip this definition
+                i += 1
+                # skip following blank line if present
+                if i < len(children) and isinstance(children[i], BlankLine):
+                    i += 1
+                continue
+            filtered_children.append(children[i])
             i += 1
         # render remaining blocks
         return self.blocks_to_lines(filtered_children, max_line_length=max_line_length)
@@ -202,8 +240,7 @@ class TypstRenderer(BaseRenderer):
         # build heading line with optional inline footnote
         if num:
             # insert footnote macro inline
-            foot = self.footnotes.get(num, '')
-            heading_line = f"{marker} {text}#footnote[{foot}]"
+            heading_line = f"{marker} {text}{self.footnote_ref(num)}"
         else:
             heading_line = f"{marker} {text}"
         # create slug and append footnote number if present